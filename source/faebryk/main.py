@@ -32,8 +32,8 @@ K = 1000
 M = 1000_000
 G = 1000_000_000
 
-n = 0.001 * 0.001 * 0.001
-u = 0.001 * 0.001
+n = 1e-9
+u = 1e-6
 
 
 class Project(Component):
@@ -73,8 +73,11 @@ netlist = from_faebryk_t2_netlist(make_t2_netlist_from_t1(t1_))
 
 Path("./build/faebryk/").mkdir(parents=True, exist_ok=True)
 path = Path("./build/faebryk/faebryk.net")
-logger.info("Writing Experiment netlist to {}".format(path.resolve()))
-path.write_text(netlist, encoding="utf-8")
+if path.exists() and path.read_text(encoding="utf-8") == netlist:
+    logger.info("Netlist %s unchanged, not rewriting", path.resolve())
+else:
+    logger.info("Writing Experiment netlist to %s", path.resolve())
+    path.write_text(netlist, encoding="utf-8")
 
 from faebryk.exporters.netlist.netlist import render_graph
 